@@ -1,17 +1,101 @@
+from typing import Callable, Dict, Tuple, cast
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from src.core.alpha_engine import feature, multi_tf_feature
 from src.core.risk_model import RiskModel
 from src.core.types import Timeframe
 
+Windows = npt.NDArray[np.float64]  # (rows, window) sliding-window view
+
+
+def _window_std(w: Windows) -> npt.NDArray[np.float64]:
+    """
+    Sample std of each window. Deviations are taken from the window's
+    first value, so constant windows come out exactly 0 as in pandas.
+    """
+    d = w - w[:, :1]
+    s = d.sum(axis=1)
+    ss = np.einsum("ij,ij->i", d, d)
+    n = w.shape[1]
+    return cast(
+        npt.NDArray[np.float64],
+        np.sqrt(np.maximum(ss - s * s / n, 0.0) / (n - 1)),
+    )
+
+
+_WINDOW_STATS: Dict[str, Callable[[Windows], npt.NDArray[np.float64]]] = {
+    "mean": lambda w: w.mean(axis=1),
+    "sum": lambda w: w.sum(axis=1),
+    "std": _window_std,
+}
+
+
+def _id_blocks(
+    df: pd.DataFrame,
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """
+    Stable row order grouping rows by internal_id, plus each sorted row's
+    offset within its security's block. Rows whose window or lag would
+    reach back past offset 0 belong to the previous security and are
+    blanked by the caller.
+    """
+    ids = df["internal_id"].to_numpy()
+    order = np.argsort(ids, kind="stable")
+    ids = ids[order]
+    n = len(ids)
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    offset = np.arange(n) - np.repeat(starts, np.diff(np.r_[starts, n]))
+    return order, offset
+
+
+def _unsorted(
+    values: npt.NDArray[np.float64],
+    order: npt.NDArray[np.intp],
+    index: pd.Index,
+) -> pd.Series:
+    out = np.empty(len(order))
+    out[order] = values
+    return pd.Series(out, index=index)
+
+
+def _grouped_rolling(
+    df: pd.DataFrame, col: str, window: int, stat: str
+) -> pd.Series:
+    """
+    Per-security rolling statistic ('mean', 'sum' or 'std'): every
+    window of the id-ordered column is reduced on its own from one
+    sliding-window view, so no running state carries across securities.
+    Windows spanning two securities are masked out, matching
+    groupby(...).rolling(window).
+    """
+    order, offset = _id_blocks(df)
+    values = np.full(len(order), np.nan)
+    if len(order) >= window:
+        windows = sliding_window_view(
+            df[col].to_numpy(dtype=np.float64)[order], window
+        )
+        values[window - 1 :] = _WINDOW_STATS[stat](windows)
+    values[offset < window - 1] = np.nan
+    return _unsorted(values, order, df.index)
+
 
 @multi_tf_feature(
     name="returns_raw", timeframes=[Timeframe.DAY, Timeframe.MIN_30]
 )
 def returns_raw(df: pd.DataFrame, tf: Timeframe) -> pd.Series:
     col = f"close_{tf.value}"
-    return df.groupby("internal_id")[col].pct_change(fill_method=None)
+    order, offset = _id_blocks(df)
+    close = df[col].to_numpy(dtype=np.float64)[order]
+    prev = np.empty_like(close)
+    prev[1:] = close[:-1]
+    prev[offset == 0] = np.nan  # first bar of each security
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = close / prev - 1
+    return _unsorted(rets, order, df.index)
 
 
 @multi_tf_feature(
@@ -40,14 +124,15 @@ def returns_residual(df: pd.DataFrame, tf: Timeframe) -> pd.Series:
     res_matrix = RiskModel.get_residual_returns(
         clean_pivot.values, n_factors=min(3, clean_pivot.shape[1] - 1)
     )
-    res_df = pd.DataFrame(
-        res_matrix, index=clean_pivot.index, columns=clean_pivot.columns
-    )
 
-    # Map back to original dataframe index
-    lookup = res_df.stack().reset_index(name="res")
-    merged = df.merge(lookup, on=["timestamp", "internal_id"], how="left")
-    return pd.Series(merged["res"].values, index=df.index)
+    # Map back to original rows by gathering (timestamp, asset) positions
+    # straight out of the residual matrix; keys absent from it give NaN.
+    rows = clean_pivot.index.get_indexer(df["timestamp"])
+    cols = clean_pivot.columns.get_indexer(df["internal_id"])
+    found = (rows >= 0) & (cols >= 0)
+    out = np.full(len(df), np.nan)
+    out[found] = res_matrix[rows[found], cols[found]]
+    return pd.Series(out, index=df.index)
 
 
 @multi_tf_feature(
@@ -57,12 +142,7 @@ def returns_residual(df: pd.DataFrame, tf: Timeframe) -> pd.Series:
 )
 def residual_vol_20(df: pd.DataFrame, tf: Timeframe) -> pd.Series:
     res_col = f"returns_residual_{tf.value}"
-    return (
-        df.groupby("internal_id")[res_col]
-        .rolling(window=20)
-        .std()
-        .reset_index(level=0, drop=True)
-    )
+    return _grouped_rolling(df, res_col, 20, "std")
 
 
 @multi_tf_feature(
@@ -72,19 +152,9 @@ def residual_vol_20(df: pd.DataFrame, tf: Timeframe) -> pd.Series:
 )
 def residual_mom_10(df: pd.DataFrame, tf: Timeframe) -> pd.Series:
     res_col = f"returns_residual_{tf.value}"
-    return (
-        df.groupby("internal_id")[res_col]
-        .rolling(window=10)
-        .sum()
-        .reset_index(level=0, drop=True)
-    )
+    return _grouped_rolling(df, res_col, 10, "sum")
 
 
 @feature(name="sma_20_30min")
 def sma_20_30min(df: pd.DataFrame) -> pd.Series:
-    return (
-        df.groupby("internal_id")["close_30min"]
-        .rolling(window=20)
-        .mean()
-        .reset_index(level=0, drop=True)
-    )
+    return _grouped_rolling(df, "close_30min", 20, "mean")
@@ -1,5 +1,6 @@
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from src.core.alpha_engine import AlphaModel
@@ -17,11 +18,10 @@ class MomentumModel(AlphaModel):
         self.feature_names = ["residual_mom_10_30min"]
 
     def compute_signals(self, latest: pd.DataFrame) -> Dict[int, float]:
-        return {
-            int(idx): float(row["residual_mom_10_30min"])
-            for idx, row in latest.iterrows()
-            if not pd.isna(row["residual_mom_10_30min"])
-        }
+        mom = latest["residual_mom_10_30min"].to_numpy(dtype=np.float64)
+        keep = ~np.isnan(mom)
+        iids = latest.index.to_numpy(dtype=np.int64)[keep]
+        return dict(zip(iids.tolist(), mom[keep].tolist()))
 
 
 class ReversionModel(AlphaModel):
@@ -39,14 +39,12 @@ class ReversionModel(AlphaModel):
         ]
 
     def compute_signals(self, latest: pd.DataFrame) -> Dict[int, float]:
-        signals = {}
-        for idx, row in latest.iterrows():
-            res = float(row["returns_residual_30min"])
-            vol = float(row["residual_vol_20_30min"])
-
-            if vol > 0 and not pd.isna(res):
-                signals[int(idx)] = -(res / vol)
-        return signals
+        res = latest["returns_residual_30min"].to_numpy(dtype=np.float64)
+        vol = latest["residual_vol_20_30min"].to_numpy(dtype=np.float64)
+        # One finiteness mask: NaN/inf inputs would poison the zscore
+        keep = np.isfinite(res) & np.isfinite(vol) & (vol > 0)
+        iids = latest.index.to_numpy(dtype=np.int64)[keep]
+        return dict(zip(iids.tolist(), (-(res[keep] / vol[keep])).tolist()))
 
 
 class EarningsModel(AlphaModel):
@@ -56,7 +54,8 @@ class EarningsModel(AlphaModel):
     """
 
     def compute_signals(self, latest: pd.DataFrame) -> Dict[int, float]:
-        signals = {int(iid): 0.0 for iid in latest.index}
+        iids = latest.index.to_numpy(dtype=np.int64).tolist()
+        signals = dict.fromkeys(iids, 0.0)
 
         now = self.context_as_of
 
@@ -64,18 +63,29 @@ class EarningsModel(AlphaModel):
             return signals
 
         # Query events from the last 24h
-        events = self.get_events(
-            list(latest.index),
+        events = self.get_events_df(
+            iids,
             types=["EARNINGS_RELEASE"],
             start=now - pd.Timedelta(hours=24),
         )
 
-        for ev in events:
-            surprise = ev.value.get("surprise_pct", 0)
-            if surprise > 0:
-                # Linear decay over 24 hours
-                hours_since = (now - ev.timestamp).total_seconds() / 3600
-                decay = max(0.0, 1.0 - (hours_since / 24.0))
-                signals[ev.internal_id] = 0.5 * decay
+        surprise = np.fromiter(
+            (v.get("surprise_pct", 0) for v in events["value"]),
+            dtype=np.float64,
+            count=len(events),
+        )
+        positive = surprise > 0
+        if not positive.any():
+            return signals
 
+        # Linear decay over 24 hours, for all events at once
+        event_ts = events["timestamp"].to_numpy(dtype="datetime64[ns]")
+        hours_since = (
+            np.datetime64(now, "ns") - event_ts[positive]
+        ) / np.timedelta64(1, "h")
+        decay = np.maximum(0.0, 1.0 - hours_since / 24.0)
+        event_iids = events["internal_id"].to_numpy(dtype=np.int64)
+        signals.update(
+            zip(event_iids[positive].tolist(), (0.5 * decay).tolist())
+        )
         return signals
@@ -1,28 +1,39 @@
-from typing import Dict
+import math
+from typing import Dict, Union
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
 
+# Series or raw float arrays; both are read through np.asarray
+FloatSeries = Union[pd.Series, npt.NDArray[np.float64]]
+
 
 class PerformanceAnalyzer:
     @staticmethod
     def calculate_sharpe(
-        returns: pd.Series, freq_multiplier: float = 252
+        returns: FloatSeries, freq_multiplier: float = 252
     ) -> float:
-        if returns.empty or returns.std() == 0:
+        a = np.asarray(returns, dtype=np.float64)
+        a = a[~np.isnan(a)]  # pandas moments skip NaNs
+        if a.size <= 1:  # sample std is undefined
+            return 0.0
+        std = a.std(ddof=1)
+        if std == 0:
             return 0.0
-        return float(returns.mean() / returns.std() * np.sqrt(freq_multiplier))
+        return float(a.mean() / std * math.sqrt(freq_multiplier))
 
     @staticmethod
-    def calculate_drawdown(equity_curve: pd.Series) -> Dict[str, float]:
-        if equity_curve.empty:
+    def calculate_drawdown(equity_curve: FloatSeries) -> Dict[str, float]:
+        eq = np.asarray(equity_curve, dtype=np.float64)
+        if eq.size == 0:
             return {"max_dd": 0.0}
-        running_max = equity_curve.cummax()
-        drawdown = (equity_curve - running_max) / running_max
+        # fmax/nanmin mirror pandas' cummax/min, which skip NaNs
+        running_max = np.fmax.accumulate(eq)
+        drawdown = (eq - running_max) / running_max
         return {
-            "max_dd": float(drawdown.min()),
-            "current_dd": float(drawdown.iloc[-1]),
+            "max_dd": float(np.nanmin(drawdown)),
+            "current_dd": float(drawdown[-1]),
         }
 
     @staticmethod
@@ -35,8 +46,15 @@ class PerformanceAnalyzer:
         Decomposes a single-period return using PCA components.
         """
         iids = sorted(portfolio_weights.keys())
-        w = np.array([portfolio_weights[i] for i in iids])
-        r = np.array([asset_returns.get(i, 0.0) for i in iids])
+        n = len(iids)
+        w = np.fromiter(
+            (portfolio_weights[i] for i in iids), dtype=np.float64, count=n
+        )
+        r = np.fromiter(
+            (asset_returns.get(i, 0.0) for i in iids),
+            dtype=np.float64,
+            count=n,
+        )
 
         total_return = w @ r
 
@@ -44,8 +62,9 @@ class PerformanceAnalyzer:
         # since B is orthogonal from PCA, f = B' r
         f = factor_loadings.T @ r
 
-        # Factor Contribution = w' * B * f
-        contribution_from_factors = w @ factor_loadings @ f
+        # Factor Contribution = (w' B) f
+        exposures = w @ factor_loadings
+        contribution_from_factors = exposures @ f
         selection_alpha = total_return - contribution_from_factors
 
         return {
@@ -65,54 +84,56 @@ class PerformanceAnalyzer:
         """
         df = returns_df.copy()
         df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df = df.set_index("timestamp")
-
-        # Define aggregation logic
-        resampled = df.resample(freq)
-
-        def calc_metrics(group: pd.DataFrame) -> pd.Series:
-            if group.empty:
-                return pd.Series(dtype=float)
-
-            # Cumulative returns for the period
-            gross_cum = (1 + group["gross_ret"]).prod() - 1
-            net_cum = (1 + group["net_ret"]).prod() - 1
-
-            # Multiplier for annualization
-            # Frequencies: D=Daily, W=Weekly, ME=MonthEnd, YE=YearEnd
-            ann_factor = 252  # Default
-            if freq == "W":
-                ann_factor = 52
-            elif freq in ["M", "ME"]:
-                ann_factor = 12
-            elif freq in ["Y", "YE"]:
-                ann_factor = 1
-
-            g_sharpe = PerformanceAnalyzer.calculate_sharpe(
-                group["gross_ret"], freq_multiplier=ann_factor
-            )
-            n_sharpe = PerformanceAnalyzer.calculate_sharpe(
-                group["net_ret"], freq_multiplier=ann_factor
-            )
-
-            # Max Drawdown for the period
-            equity = (1 + group["net_ret"]).cumprod()
-            mdd = PerformanceAnalyzer.calculate_drawdown(equity)["max_dd"]
-
-            return pd.Series(
-                {
-                    "Return (Net)": f"{net_cum:.2%}",
-                    "Return (Gross)": f"{gross_cum:.2%}",
-                    "Ann. Sharpe (Net)": f"{n_sharpe:.2f}",
-                    "Ann. Sharpe (Gross)": f"{g_sharpe:.2f}",
-                    "Max Drawdown": f"{mdd:.2%}",
-                }
-            )
-
-        resampled_metrics = resampled.apply(calc_metrics)
+        df = df.set_index("timestamp").sort_index(kind="stable")
+        rets = df[["gross_ret", "net_ret"]].astype(np.float64)
+
+        # Multiplier for annualization
+        # Frequencies: D=Daily, W=Weekly, ME=MonthEnd, YE=YearEnd
+        ann_factor = 252  # Default
+        if freq == "W":
+            ann_factor = 52
+        elif freq in ["M", "ME"]:
+            ann_factor = 12
+        elif freq in ["Y", "YE"]:
+            ann_factor = 1
+        ann_sqrt = math.sqrt(ann_factor)
+
+        # Empty periods (e.g. weekends at daily frequency) are dropped
+        g = rets.groupby(pd.Grouper(freq=freq))
+        cum = (1 + rets).groupby(pd.Grouper(freq=freq)).prod() - 1
+        mean, std, count = g.mean(), g.std(), g.count()
+        sharpe = (mean / std * ann_sqrt).where((count > 1) & (std != 0), 0.0)
+
+        # Max Drawdown for the period, from the in-period net equity path
+        equity = (1 + rets["net_ret"]).groupby(pd.Grouper(freq=freq)).cumprod()
+        running_max = equity.groupby(pd.Grouper(freq=freq)).cummax()
+        drawdown = ((equity - running_max) / running_max).groupby(
+            pd.Grouper(freq=freq)
+        )
+        metrics = pd.DataFrame(
+            {
+                "Return (Net)": cum["net_ret"],
+                "Return (Gross)": cum["gross_ret"],
+                "Ann. Sharpe (Net)": sharpe["net_ret"],
+                "Ann. Sharpe (Gross)": sharpe["gross_ret"],
+                "Max Drawdown": drawdown.min(),
+            }
+        )[count["net_ret"] > 0]
 
         # Calculate summary row
-        summary_metrics = calc_metrics(df)
-        summary_metrics.name = "Summary"
-
-        return pd.concat([resampled_metrics, summary_metrics.to_frame().T])
+        summary_equity = (1 + rets["net_ret"]).cumprod()
+        metrics.loc["Summary"] = [
+            (1 + rets["net_ret"]).prod() - 1,
+            (1 + rets["gross_ret"]).prod() - 1,
+            PerformanceAnalyzer.calculate_sharpe(rets["net_ret"], ann_factor),
+            PerformanceAnalyzer.calculate_sharpe(
+                rets["gross_ret"], ann_factor
+            ),
+            PerformanceAnalyzer.calculate_drawdown(summary_equity)["max_dd"],
+        ]
+
+        table = pd.DataFrame(index=metrics.index.rename(None))
+        for col in metrics.columns:
+            fmt = "{:.2f}" if col.startswith("Ann.") else "{:.2%}"
+            table[col] = metrics[col].map(fmt.format)
+        return table
@@ -2,6 +2,7 @@ import os
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -32,23 +33,22 @@ class MarketDataMock(BarProvider, CorporateActionProvider, EventProvider):
     ) -> pd.DataFrame:
         freq = timeframe.value
         dates = pd.date_range(start, end, freq=freq)
-        data = []
-        for ticker in tickers:
-            for timestamp in dates:
-                price = 100.0 + (pd.Timestamp(timestamp).hour - 10) * 0.1
-                data.append(
-                    {
-                        "ticker": ticker,
-                        "timestamp": timestamp,
-                        "open": price - 0.1,
-                        "high": price + 0.5,
-                        "low": price - 0.4,
-                        "close": price,
-                        "volume": 50000.0,
-                        "timeframe": timeframe,
-                    }
-                )
-        return pd.DataFrame(data)
+        # Ticker-major (N * T) columns; the price path depends only on hour
+        price = np.tile(
+            100.0 + (dates.hour.to_numpy() - 10) * 0.1, len(tickers)
+        )
+        return pd.DataFrame(
+            {
+                "ticker": pd.Categorical(np.repeat(tickers, len(dates))),
+                "timestamp": np.tile(dates.to_numpy(), len(tickers)),
+                "open": price - 0.1,
+                "high": price + 0.5,
+                "low": price - 0.4,
+                "close": price,
+                "volume": 50000.0,
+                "timeframe": [timeframe] * len(price),
+            }
+        )
 
     def fetch_corporate_actions(
         self,
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, Optional, TypedDict, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -12,7 +12,6 @@ from src.core.alpha_engine import (
     AlphaModel,
     ModelRunConfig,
     SignalCombiner,
-    SignalProcessor,
 )
 from src.core.data_platform import DataPlatform
 from src.core.portfolio_manager import PortfolioManager
@@ -64,26 +63,46 @@ class BacktestEngine:
         self.data = data
         self.pm = pm
         self.capital = initial_capital
-        self.equity_curve = [initial_capital]
+        # Pre-sized per run; equity_curve views the used part
+        self._equity = np.full(1, initial_capital)
+        self._n_equity = 1
         self.interval_results: List[IntervalResult] = []
         self.status = "ACTIVE"
 
+    @property
+    def equity_curve(self) -> npt.NDArray[np.float64]:
+        return self._equity[: self._n_equity]
+
+    def _reserve_equity(self, extra: int) -> None:
+        """Grows the equity buffer to hold 'extra' more points."""
+        needed = self._n_equity + extra
+        if needed > len(self._equity):
+            buf = np.empty(needed)
+            buf[: self._n_equity] = self.equity_curve
+            self._equity = buf
+
+    def _record_equity(self, value: float) -> None:
+        if self._n_equity == len(self._equity):
+            self._reserve_equity(1)
+        self._equity[self._n_equity] = value
+        self._n_equity += 1
+
     def _calculate_tcosts(
         self,
         weights_opt: Dict[int, float],
         prev_weights: Dict[int, float],
         config: BacktestConfig,
     ) -> float:
-        total_tcost = 0.0
-        all_iids = set(prev_weights.keys()) | set(weights_opt.keys())
-        for iid in all_iids:
-            dw = weights_opt.get(iid, 0.0) - prev_weights.get(iid, 0.0)
-            if dw == 0:
-                continue
-            linear_cost = abs(dw) * (config.slippage_bps / 10000.0)
-            impact_cost = (dw**2) * (config.market_impact_coef / 10000.0)
-            total_tcost += linear_cost + impact_cost
-        return total_tcost
+        # optimize() returns the current dict itself when it keeps the book
+        if weights_opt is prev_weights:
+            return 0.0
+        dw = dict(weights_opt)
+        for iid, w in prev_weights.items():
+            dw[iid] = dw.get(iid, 0.0) - w
+        trades = np.fromiter(dw.values(), dtype=np.float64, count=len(dw))
+        linear_cost = np.abs(trades).sum() * (config.slippage_bps / 10000.0)
+        impact_cost = (trades**2).sum() * (config.market_impact_coef / 10000.0)
+        return float(linear_cost + impact_cost)
 
     def _simulate_interval_returns(
         self,
@@ -93,50 +112,89 @@ class BacktestEngine:
         config: BacktestConfig,
         close_col: str,
     ) -> float:
-        current_bars = self.data.get_bars(
-            iids, QueryConfig(start=ts, end=ts, timeframe=config.timeframe)
-        )
-
         # FIX: Use config.timeframe for next step, not hardcoded 1h
         delta = pd.to_timedelta(config.timeframe.pandas_freq)
         next_ts = ts + delta
 
-        next_bars = self.data.get_bars(
+        bars = self.data.get_bars(
             iids,
             QueryConfig(
-                start=next_ts, end=next_ts, timeframe=config.timeframe
+                start=ts,
+                end=next_ts,
+                timeframe=config.timeframe,
+                resample=False,
             ),
         )
+        if not bars.empty:
+            current_bars = bars[bars.timestamp == ts]
+            next_bars = bars[bars.timestamp == next_ts]
+        else:
+            # Resampled minute buckets are labelled by their start, so a
+            # [ts, next_ts] read would close the ts bar at next_ts - 1min.
+            current_bars, next_bars = (
+                self.data.get_bars(
+                    iids,
+                    QueryConfig(start=t, end=t, timeframe=config.timeframe),
+                )
+                for t in (ts, next_ts)
+            )
 
-        interval_gross_ret = 0.0
-        if not current_bars.empty and not next_bars.empty:
-            p0 = {
-                row["internal_id"]: float(row[close_col])
-                for _, row in current_bars.iterrows()
-            }
-            p1 = {
-                row["internal_id"]: float(row[close_col])
-                for _, row in next_bars.iterrows()
-            }
-            common_iids = set(p0.keys()) & set(p1.keys())
-            for i in common_iids:
-                asset_ret = p1[i] / p0[i] - 1
-                interval_gross_ret += weights_opt.get(i, 0.0) * asset_ret
-        return interval_gross_ret
+        if current_bars.empty or next_bars.empty:
+            return 0.0
+
+        # Assets missing from either snapshot are NaN and drop out
+        p0 = self._close_vector(current_bars, iids, close_col)
+        p1 = self._close_vector(next_bars, iids, close_col)
+        w = np.fromiter(
+            (weights_opt.get(i, 0.0) for i in iids),
+            dtype=np.float64,
+            count=len(iids),
+        )
+        return float(np.nansum(w * (p1 / p0 - 1)))
+
+    @staticmethod
+    def _close_vector(
+        bars: pd.DataFrame, iids: List[int], close_col: str
+    ) -> npt.NDArray[np.float64]:
+        closes = bars.set_index("internal_id")[close_col].reindex(iids)
+        return cast(npt.NDArray[np.float64], closes.to_numpy(dtype=np.float64))
+
+    @staticmethod
+    def _returns_history(
+        bars: pd.DataFrame, close_col: str
+    ) -> npt.NDArray[np.float64]:
+        """
+        (T-1, N) simple returns of the close panel, keeping only periods
+        where every asset has a return (pct_change(...).dropna() on the
+        raw array).
+        """
+        prices = bars.pivot(
+            index="timestamp", columns="internal_id", values=close_col
+        ).to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = prices[1:] / prices[:-1] - 1
+        return np.ascontiguousarray(rets[~np.isnan(rets).any(axis=1)])
 
     def run(self, config: BacktestConfig) -> BacktestReport:
         """Runs the simulation."""
         trading_days = pd.date_range(
             config.start_date, config.end_date, freq="B"
         )
+        self._reserve_equity(2 * len(trading_days))
+        close_col = f"close_{config.timeframe.value}"
+        fixed_iids = (
+            sorted([self.data.get_internal_id(t) for t in config.tickers])
+            if config.tickers
+            else None
+        )
 
         for day in trading_days:
             if self.status == "KILLED":
                 break
 
             iids = (
-                sorted([self.data.get_internal_id(t) for t in config.tickers])
-                if config.tickers
+                fixed_iids
+                if fixed_iids is not None
                 else sorted(self.data.get_universe(day))
             )
             if not iids:
@@ -153,50 +211,35 @@ class BacktestEngine:
             if hist_df.empty:
                 continue
 
-            close_col = f"close_{config.timeframe.value}"
-            pivot_rets = (
-                hist_df.pivot(
-                    index="timestamp", columns="internal_id", values=close_col
-                )
-                .pct_change(fill_method=None)
-                .dropna()
-            )
-            self.pm.update_risk_model(pivot_rets.values)
+            hist_rets = self._returns_history(hist_df, close_col)
+            self.pm.update_risk_model(hist_rets)
 
-            # Estimate expected factor returns (E[f]) from history
-            hist_factor_rets = self.pm.get_factor_returns(pivot_rets.values)
-            expected_factor_returns = np.mean(hist_factor_rets, axis=0)
+            # Use expected_factor_returns if config doesn't override
+            f_rets = (
+                config.factor_returns
+                if config.factor_returns is not None
+                else self.pm.expected_factor_returns
+            )
 
             for ts in [day + timedelta(hours=10), day + timedelta(hours=15)]:
                 if not self.pm.check_safety(
-                    self.equity_curve[-1] / self.capital
+                    self.equity_curve[-1] / self.capital, now=ts
                 ):
                     self.status = "KILLED"
                     break
 
-                signals = [
-                    AlphaEngine.run_model(
-                        self.data,
-                        m,
-                        iids,
-                        ModelRunConfig(
-                            timestamp=ts, timeframe=config.timeframe
-                        ),
-                    )
-                    for m in config.alpha_models
-                ]
+                signals = AlphaEngine.run_models(
+                    self.data,
+                    config.alpha_models,
+                    iids,
+                    ModelRunConfig(timestamp=ts, timeframe=config.timeframe),
+                )
                 combined = SignalCombiner.combine(
-                    [SignalProcessor.zscore(s) for s in signals],
-                    weights=config.weights,
+                    signals, weights=config.weights, standardize=True
                 )
 
-                prev_weights = self.pm.current_weights.copy()
-                # Use expected_factor_returns if config doesn't override
-                f_rets = (
-                    config.factor_returns
-                    if config.factor_returns is not None
-                    else expected_factor_returns
-                )
+                # optimize() rebinds current_weights; this is the old book
+                prev_weights = self.pm.current_weights
                 weights_opt = self.pm.optimize(combined, factor_returns=f_rets)
 
                 total_tcost = self._calculate_tcosts(
@@ -215,7 +258,7 @@ class BacktestEngine:
                         "tcost": total_tcost,
                     }
                 )
-                self.equity_curve.append(self.equity_curve[-1] * (1 + net_ret))
+                self._record_equity(self.equity_curve[-1] * (1 + net_ret))
 
         return self.report(config.report_freq)
 
@@ -237,15 +280,15 @@ class BacktestEngine:
         )
 
         # Full curve stats
-        equity_series = pd.Series(self.equity_curve)
-        net_returns = results_df["net_ret"]
+        equity = self.equity_curve
+        net_returns = results_df["net_ret"].to_numpy(dtype=np.float64)
 
         return {
             "status": self.status,
             "message": None,
-            "total_return": self.equity_curve[-1] / self.equity_curve[0] - 1,
+            "total_return": float(equity[-1] / equity[0] - 1),
             "sharpe": PerformanceAnalyzer.calculate_sharpe(net_returns),
-            "drawdown": PerformanceAnalyzer.calculate_drawdown(equity_series),
-            "final_equity": self.equity_curve[-1],
+            "drawdown": PerformanceAnalyzer.calculate_drawdown(equity),
+            "final_equity": float(equity[-1]),
             "performance_table": perf_table,
         }
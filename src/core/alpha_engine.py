@@ -3,9 +3,10 @@ from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Dict, Generator, List, Optional
+from typing import Callable, Dict, Generator, List, Optional, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from src.core.types import Event, QueryConfig, Timeframe
@@ -92,11 +93,31 @@ class SignalProcessor:
     def zscore(signals: Dict[int, float]) -> Dict[int, float]:
         if not signals:
             return {}
-        vals = np.array(list(signals.values()))
-        mu, std = vals.mean(), vals.std()
+        vals = np.fromiter(
+            signals.values(), dtype=np.float64, count=len(signals)
+        )
+        dev = vals - vals.mean()
+        std = np.sqrt(dev @ dev / len(dev))
         if std == 0:
             return {k: 0.0 for k in signals}
-        return {k: float((v - mu) / std) for k, v in signals.items()}
+        dev /= std
+        return dict(zip(signals, dev.tolist()))
+
+    @staticmethod
+    def zscore_rows(
+        mat: npt.NDArray[np.float64], present: npt.NDArray[np.bool_]
+    ) -> npt.NDArray[np.float64]:
+        """
+        zscore applied to each row of a (models x assets) matrix over its
+        'present' entries; absent entries, and rows with no spread, are 0.
+        """
+        count = np.maximum(present.sum(axis=1, keepdims=True), 1)
+        mean = np.where(present, mat, 0.0).sum(axis=1, keepdims=True) / count
+        dev = np.where(present, mat - mean, 0.0)
+        std = np.sqrt((dev * dev).sum(axis=1, keepdims=True) / count)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = dev / std
+        return cast(npt.NDArray[np.float64], np.where(std == 0, 0.0, z))
 
 
 class AlphaModel(ABC):
@@ -130,6 +151,28 @@ class AlphaModel(ABC):
             as_of=as_of,
         )
 
+    @staticmethod
+    def get_events_df(
+        iids: List[int],
+        types: Optional[List[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Like get_events, but returns the events as columns."""
+        data = _context_data.get()
+        as_of = _context_as_of.get()
+        if data is None:
+            raise RuntimeError(
+                "get_events_df called outside of model execution."
+            )
+        return data.get_events_df(
+            iids,
+            types=types,
+            start=start,
+            end=end,
+            as_of=as_of,
+        )
+
     @abstractmethod
     def compute_signals(self, latest: pd.DataFrame) -> Dict[int, float]:
         """
@@ -165,11 +208,32 @@ class AlphaEngine:
         internal_ids: List[int],
         config: ModelRunConfig,
     ) -> Dict[int, float]:
+        return AlphaEngine.run_models(data, [model], internal_ids, config)[0]
+
+    @staticmethod
+    def run_models(
+        data: DataPlatform,
+        models: List[AlphaModel],
+        internal_ids: List[int],
+        config: ModelRunConfig,
+    ) -> List[Dict[int, float]]:
+        """
+        Runs several models at one timestamp off a single bar fetch and
+        feature hydration; the 'latest' frame is shared, so models must
+        treat it as read-only.
+        """
         # Ensure all features are registered
         import src.alpha_library.features  # noqa: F401, PLC0415
 
-        # 1. Fetch Bars
-        start = config.timestamp - pd.Timedelta(days=config.lookback_days)
+        feature_names = list(
+            dict.fromkeys(f for m in models for f in m.feature_names)
+        )
+
+        # 1. Fetch Bars (history only if there are features to hydrate;
+        # otherwise the models just read the target timestamp's slice)
+        start = config.timestamp
+        if any(f in FEATURES for f in feature_names):
+            start -= pd.Timedelta(days=config.lookback_days)
         df = data.get_bars(
             internal_ids,
             QueryConfig(
@@ -179,10 +243,10 @@ class AlphaEngine:
             ),
         )
         if df.empty:
-            return {}
+            return [{} for _ in models]
 
-        # 2. Hydrate requested features
-        AlphaEngine._hydrate_features(df, model.feature_names)
+        # 2. Hydrate the union of requested features once
+        AlphaEngine._hydrate_features(df, feature_names)
 
         # 3. Slice for latest timestamp
         latest = df[df["timestamp"] == config.timestamp].set_index(
@@ -191,7 +255,7 @@ class AlphaEngine:
 
         # 4. Model execution with context
         with alpha_context(data, config.timestamp):
-            return model.compute_signals(latest)
+            return [m.compute_signals(latest) for m in models]
 
 
 class SignalCombiner:
@@ -199,14 +263,30 @@ class SignalCombiner:
     def combine(
         signals_list: List[Dict[int, float]],
         weights: Optional[List[float]] = None,
+        standardize: bool = False,
     ) -> Dict[int, float]:
+        """
+        Weighted blend of per-model signals. standardize=True z-scores
+        each model's row of the stacked matrix first, which matches
+        combining SignalProcessor.zscore outputs without the dicts.
+        """
         if not signals_list:
             return {}
         if weights is None:
             weights = [1.0 / len(signals_list)] * len(signals_list)
 
-        combined: Dict[int, float] = {}
-        for signals, weight in zip(signals_list, weights):
-            for iid, val in signals.items():
-                combined[iid] = combined.get(iid, 0.0) + val * weight
-        return combined
+        # (models x assets); an asset missing from a model contributes 0
+        pairs = list(zip(signals_list, weights))
+        iids = list(dict.fromkeys(i for s, _ in pairs for i in s))
+        col = {iid: k for k, iid in enumerate(iids)}
+        mat = np.zeros((len(pairs), len(iids)))
+        present = np.zeros(mat.shape, dtype=bool)
+        for r, (signals, _) in enumerate(pairs):
+            cols = [col[i] for i in signals]
+            mat[r, cols] = list(signals.values())
+            present[r, cols] = True
+        if standardize:
+            mat = SignalProcessor.zscore_rows(mat, present)
+        w = np.array([wt for _, wt in pairs], dtype=np.float64)
+        combined = w @ mat
+        return dict(zip(iids, combined.tolist()))
@@ -1,9 +1,11 @@
 import json
 import warnings
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from arcticdb import Arctic, QueryBuilder
 
@@ -20,6 +22,57 @@ from src.core.types import (
 _ARCTIC_CACHE: Dict[str, Arctic] = {}
 
 
+def _columns(cls: Any, items: Sequence[Any]) -> Dict[str, List[Any]]:
+    """
+    Dataclass instances as per-field column lists for pd.DataFrame.
+    """
+    return {f.name: [getattr(x, f.name) for x in items] for f in fields(cls)}
+
+
+def _latest_known(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Point-in-time deduplication: keeps the row with the latest
+    timestamp_knowledge for each (internal_id, timestamp). The latest
+    revision wins as a whole row, NaNs included; earlier revisions do
+    not fill its gaps the way groupby().last() would. Column order is
+    kept as is. A single lexsort plus a run-boundary mask replaces a
+    hash groupby.
+    """
+    iid = df["internal_id"].to_numpy()
+    ts = df["timestamp"].to_numpy()
+    order = np.lexsort((df["timestamp_knowledge"].to_numpy(), ts, iid))
+    iid, ts = iid[order], ts[order]
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = (iid[1:] != iid[:-1]) | (ts[1:] != ts[:-1])
+    return df.iloc[order[last]].reset_index(drop=True)
+
+
+def _storable(col: pd.Series) -> pd.Series:
+    """
+    Unwraps Timeframe members and strips timezones. Already-typed columns
+    (all-string objects, naive datetime64) pass through untouched.
+    """
+    if col.dtype == object:
+        if pd.api.types.infer_dtype(col, skipna=True) == "string":
+            return col
+        return col.apply(lambda x: x.value if isinstance(x, Timeframe) else x)
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return _naive_datetimes(col)
+    return col
+
+
+def _naive_datetimes(col: pd.Series) -> pd.Series:
+    """
+    Coerces to tz-naive datetime64. Stored columns already are, so the
+    parse and the localize are both skipped on the common read path.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = pd.to_datetime(col)
+    if col.dt.tz is not None:
+        col = col.dt.tz_localize(None)
+    return col
+
+
 class DataPlatform:
     def __init__(
         self,
@@ -37,6 +90,7 @@ class DataPlatform:
         self.stream_provider = next(
             (p for p in providers if hasattr(p, "subscribe")), None
         )
+        self._sec_cache: Optional[Tuple[Tuple[int, int], pd.DataFrame]] = None
 
     def _safe_read(
         self, sym: str, query_builder: Optional[QueryBuilder] = None
@@ -58,12 +112,7 @@ class DataPlatform:
 
         # 1. Type Coercion & Schema Enforcement
         for c in df.columns:
-            if df[c].dtype == object:
-                df[c] = df[c].apply(
-                    lambda x: x.value if isinstance(x, Timeframe) else x
-                )
-            elif pd.api.types.is_datetime64_any_dtype(df[c]):
-                df[c] = pd.to_datetime(df[c]).dt.tz_localize(None)
+            df[c] = _storable(df[c])
 
         float_cols = set(df.columns).intersection(PRICE_VOLUME_COLS)
         for col in float_cols:
@@ -121,16 +170,24 @@ class DataPlatform:
 
     @property
     def sec_df(self) -> pd.DataFrame:
-        df = self._read("sec_df")
-        if not df.empty:
-            df["extra"] = df["extra"].apply(
-                lambda x: json.loads(x) if isinstance(x, str) else x
-            )
-        if df.empty:
+        """
+        Security master, cached per stored version. Checking the version
+        is a metadata lookup, far cheaper than re-reading and re-decoding
+        the table on every id resolution.
+        """
+        if not self.lib.has_symbol("sec_df"):
             return pd.DataFrame(
                 columns=["internal_id", "ticker", "start", "end", "extra"]
             )
-        return df
+        item = self.lib.read_metadata("sec_df")
+        key = (item.version, item.timestamp)
+        if self._sec_cache is None or self._sec_cache[0] != key:
+            df = self._safe_read("sec_df")
+            df["extra"] = df["extra"].apply(
+                lambda x: json.loads(x) if isinstance(x, str) else x
+            )
+            self._sec_cache = (key, df)
+        return self._sec_cache[1].copy()
 
     @property
     def ca_df(self) -> pd.DataFrame:
@@ -165,7 +222,7 @@ class DataPlatform:
         sec = Security(
             iid, ticker, s, e, cast(Dict[str, Any], json.dumps(kwargs))
         )
-        self._write("sec_df", pd.DataFrame([asdict(sec)]))
+        self._write("sec_df", pd.DataFrame(_columns(Security, [sec])))
         return iid
 
     def get_internal_id(
@@ -174,6 +231,50 @@ class DataPlatform:
         dt = (date or datetime.now()).replace(tzinfo=None)
         return self.register_security(ticker, start=dt)
 
+    def _resolve_ids(
+        self, df: pd.DataFrame, col: str
+    ) -> npt.NDArray[np.int64]:
+        """
+        Batched get_internal_id over the (ticker, df[col]) rows: each row
+        maps to the first listing of its ticker still live on that date.
+        Dates past every listing register one new security per ticker,
+        and all new listings are written to the master in a single batch.
+        """
+        all_dates = _naive_datetimes(df[col]).to_numpy()
+        out = np.zeros(len(df), dtype=np.int64)
+        secs = self.sec_df
+        next_iid = int(secs.internal_id.max() + 1) if not secs.empty else 1000
+        new: List[Security] = []
+        by_ticker = df.groupby("ticker", sort=False, observed=True).indices
+        for ticker, pos in by_ticker.items():
+            d = all_dates[pos]
+            ids = np.zeros(len(pos), dtype=np.int64)
+            todo = np.ones(len(pos), dtype=bool)
+            listings = secs[secs.ticker == ticker]
+            for iid, end in zip(
+                listings.internal_id, pd.to_datetime(listings.end)
+            ):
+                hit = todo & (d <= end.to_datetime64())
+                ids[hit] = iid
+                todo &= ~hit
+            if todo.any():
+                start = pd.Timestamp(d[todo].min()).to_pydatetime()
+                new.append(
+                    Security(
+                        next_iid,
+                        str(ticker),
+                        start,
+                        datetime(2200, 1, 1),
+                        cast(Dict[str, Any], json.dumps({})),
+                    )
+                )
+                ids[todo] = next_iid
+                next_iid += 1
+            out[pos] = ids
+        if new:
+            self._write("sec_df", pd.DataFrame(_columns(Security, new)))
+        return out
+
     def get_securities(
         self, tickers: Optional[List[str]] = None
     ) -> List[Security]:
@@ -186,8 +287,8 @@ class DataPlatform:
         dt = date.replace(tzinfo=None) if date.tzinfo else date
         if df.empty:
             return []
-        mask = (pd.to_datetime(df.start).dt.tz_localize(None) <= dt) & (
-            pd.to_datetime(df.end).dt.tz_localize(None) >= dt
+        mask = (_naive_datetimes(df.start) <= dt) & (
+            _naive_datetimes(df.end) >= dt
         )
         return [int(x) for x in df[mask].internal_id.unique()]
 
@@ -199,33 +300,31 @@ class DataPlatform:
         return cast(Dict[int, str], df.ticker.to_dict())
 
     def add_bars(self, bars: List[Bar]) -> None:
-        df = pd.DataFrame([asdict(b) for b in bars])
-        if df.empty:
+        if not bars:
             return
+        cols = _columns(Bar, bars)
+        cols["timeframe"] = [b.timeframe.value for b in bars]
+        df = pd.DataFrame(cols)
         m = df.internal_id <= 0
         if m.any():
-            df.loc[m, "internal_id"] = df[m].apply(
-                lambda r: self.get_internal_id(
-                    r.get("_ticker") or "", r.timestamp
-                ),
-                1,
+            unresolved = df.loc[m, ["_ticker", "timestamp"]].rename(
+                columns={"_ticker": "ticker"}
+            )
+            df.loc[m, "internal_id"] = self._resolve_ids(
+                unresolved.fillna({"ticker": ""}), "timestamp"
             )
-        if "_ticker" in df.columns:
-            df = df.drop(columns=["_ticker"])
+        df = df.drop(columns=["_ticker"])
         self._write("bars", df)
 
     def add_events(self, evs: List[Event]) -> None:
-        df = pd.DataFrame([asdict(e) for e in evs])
-        if df.empty:
+        if not evs:
             return
-        df = df.assign(value=lambda x: x.value.apply(json.dumps))
-        self._write("events", df)
+        cols = _columns(Event, evs)
+        cols["value"] = [json.dumps(v) for v in cols["value"]]
+        self._write("events", pd.DataFrame(cols))
 
     def add_ca(self, ca: CorporateAction) -> None:
-        df = pd.DataFrame([asdict(ca)])
-        if df.empty:
-            return
-        self._write("ca_df", df)
+        self._write("ca_df", pd.DataFrame(_columns(CorporateAction, [ca])))
 
     def get_bars(self, iids: List[int], cfg: QueryConfig) -> pd.DataFrame:
         def q(tf: Timeframe) -> pd.DataFrame:
@@ -243,27 +342,22 @@ class DataPlatform:
                 return pd.DataFrame()
             df = self._safe_read("bars", query_builder=qb).reset_index()
             if not df.empty:
-                df["timestamp_knowledge"] = pd.to_datetime(
+                df["timestamp_knowledge"] = _naive_datetimes(
                     df["timestamp_knowledge"]
-                ).dt.tz_localize(None)
+                )
                 df = df[df.timestamp_knowledge <= as_of]
             return df
 
         df = q(cfg.timeframe)
         if (
             df.empty
+            and cfg.resample
             and cfg.timeframe != Timeframe.MINUTE
             and cfg.timeframe.is_intraday
         ):
             df = q(Timeframe.MINUTE)
             if not df.empty:
-                df = (
-                    df.sort_values("timestamp_knowledge")
-                    .groupby(["internal_id", "timestamp"])
-                    .last()
-                    .reset_index()
-                    .set_index("timestamp")
-                )
+                df = _latest_known(df).set_index("timestamp")
                 df = (
                     df.groupby("internal_id")
                     .resample(cfg.timeframe.pandas_freq)
@@ -284,59 +378,61 @@ class DataPlatform:
         if df.empty:
             return df
         # Final Point-in-Time deduplication: keep the LATEST version available
-        df = (
-            df.sort_values("timestamp_knowledge")
-            .groupby(["internal_id", "timestamp"])
-            .last()
-            .reset_index()
-        )
+        df = _latest_known(df)
         df[["open", "high", "low", "close"]] = df[
             ["open", "high", "low", "close"]
         ].astype(float)
-        if cfg.adjust and not self.ca_df.empty:
-            ca = (
-                self.ca_df.reset_index()
-                if "ex_date" in self.ca_df.index.names
-                else self.ca_df
-            )
+        # Each ca_df access is a full read of the store
+        ca = self.ca_df if cfg.adjust else None
+        if ca is not None and not ca.empty:
+            if "ex_date" in ca.index.names:
+                ca = ca.reset_index()
             mask = ca.internal_id.isin(iids) & (ca.ex_date <= cfg.end)
             ca = ca[mask].sort_values("ex_date", ascending=False)
+            target_cols = ["open", "high", "low", "close"]
             for iid in iids:
                 f = 1.0
-                for _, r in ca[ca.internal_id == iid].iterrows():
-                    m = (df.internal_id == iid) & (df.timestamp < r.ex_date)
-                    if r.type == "SPLIT":
-                        rto = 1.0 / r.value
-                        df.loc[m, ["open", "high", "low", "close"]] *= rto
+                sub = ca[ca.internal_id == iid]
+                in_iid = df.internal_id == iid
+                for ex_date, typ, value in zip(
+                    sub.ex_date, sub.type, sub.value
+                ):
+                    m = in_iid & (df.timestamp < ex_date)
+                    if typ == "SPLIT":
+                        rto = 1.0 / value
+                        df.loc[m, target_cols] *= rto
                         f *= rto
                     else:
-                        target_cols = ["open", "high", "low", "close"]
-                        df.loc[m, target_cols] -= r.value * f
+                        df.loc[m, target_cols] -= value * f
         cols = {
             c: f"{c}_{cfg.timeframe.value}"
             for c in ["open", "high", "low", "close", "volume"]
         }
         return df.rename(columns=cols)
 
-    def get_events(
+    def get_events_df(
         self,
         iids: List[int],
         types: Optional[List[str]] = None,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
         as_of: Optional[datetime] = None,
-    ) -> List[Event]:
+    ) -> pd.DataFrame:
+        """
+        Point-in-time events as columns (one per Event field, 'value'
+        decoded), for callers that reduce over them without needing
+        Event objects.
+        """
         qb = QueryBuilder()
         as_of_dt = (as_of or datetime.now()).replace(tzinfo=None)
         qb = qb[qb.internal_id.isin(iids)]
+        cols = [f.name for f in fields(Event)]
         if not self.lib.has_symbol("events"):
-            return []
+            return pd.DataFrame(columns=cols)
         df = self._safe_read("events", query_builder=qb).reset_index()
         if df.empty:
-            return []
-        df["timestamp_knowledge"] = pd.to_datetime(
-            df["timestamp_knowledge"]
-        ).dt.tz_localize(None)
+            return pd.DataFrame(columns=cols)
+        df["timestamp_knowledge"] = _naive_datetimes(df["timestamp_knowledge"])
         df = df[df.timestamp_knowledge <= as_of_dt]
         if start:
             df = df[df.timestamp >= start.replace(tzinfo=None)]
@@ -345,15 +441,28 @@ class DataPlatform:
         if types:
             df = df[df.event_type.isin(types)]
         # Final PIT deduplication
-        df = (
-            df.sort_values("timestamp_knowledge")
-            .groupby(["internal_id", "timestamp"])
-            .last()
-            .reset_index()
-        )
+        df = _latest_known(df)[cols]
+        df["value"] = [json.loads(v) for v in df["value"]]
+        return df
+
+    def get_events(
+        self,
+        iids: List[int],
+        types: Optional[List[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[Event]:
+        df = self.get_events_df(iids, types, start, end, as_of)
         return [
-            Event(**{**r, "value": json.loads(r["value"])})
-            for r in df.to_dict("records")
+            Event(iid, ts, typ, value, known)
+            for iid, ts, typ, value, known in zip(
+                df.internal_id,
+                df.timestamp,
+                df.event_type,
+                df.value,
+                df.timestamp_knowledge,
+            )
         ]
 
     def start_streaming(self, tickers: List[str]) -> None:
@@ -371,11 +480,9 @@ class DataPlatform:
         timeframe: Timeframe = Timeframe.DAY,
     ) -> None:
         def m(df: pd.DataFrame, col: str) -> pd.DataFrame:
-            return df.assign(
-                internal_id=df.apply(
-                    lambda r: self.get_internal_id(r.ticker, r[col]), 1
-                )
-            ).drop(columns=["ticker"])
+            return df.assign(internal_id=self._resolve_ids(df, col)).drop(
+                columns=["ticker"]
+            )
 
         for p in self.providers:
             if hasattr(p, "fetch_bars"):
@@ -1,7 +1,10 @@
+import bisect
 import threading
 import time
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from src.core.types import ChildOrder, Order, OrderSide, OrderState
 from src.gateways.base import ExecutionBackend
 
@@ -30,8 +33,12 @@ class ExecutionHandler:
         while True:
             now = time.time()
             with self._lock:
-                to_fire = [c for c in self._queue if c.scheduled_at <= now]
-                self._queue = [c for c in self._queue if c.scheduled_at > now]
+                # Sorted by scheduled_at: the due children are a prefix
+                due = bisect.bisect_right(
+                    self._queue, now, key=lambda c: c.scheduled_at
+                )
+                to_fire = self._queue[:due]
+                del self._queue[:due]
 
             for child in to_fire:
                 if not child.parent.state.is_active:
@@ -99,23 +106,26 @@ class ExecutionHandler:
         trade_tolerance = 0.1
 
         # Combine goal tickers and existing position tickers
-        all_tickers |= set(current_positions.keys())
-
-        new_orders = []
-        for ticker in all_tickers:
-            target = goal_positions.get(ticker, 0.0)
-            current = current_positions.get(ticker, 0.0)
-            diff = target - current
-
-            if abs(diff) > trade_tolerance:
-                order = self.twap_execute(
-                    ticker,
-                    abs(diff),
-                    OrderSide.BUY if diff > 0 else OrderSide.SELL,
-                    interval=interval,
-                )
-                new_orders.append(order)
-        return new_orders
+        tickers = list(dict.fromkeys([*goal_positions, *current_positions]))
+        diffs = np.fromiter(
+            (
+                goal_positions.get(t, 0.0) - current_positions.get(t, 0.0)
+                for t in tickers
+            ),
+            dtype=np.float64,
+            count=len(tickers),
+        )
+
+        (to_trade,) = np.nonzero(np.abs(diffs) > trade_tolerance)
+        return [
+            self.twap_execute(
+                tickers[k],
+                abs(float(diffs[k])),
+                OrderSide.BUY if diffs[k] > 0 else OrderSide.SELL,
+                interval=interval,
+            )
+            for k in to_trade
+        ]
 
     def execute_direct(
         self, ticker: str, quantity: float, side: OrderSide
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, cast
 
 import cvxpy as cp
 import numpy as np
@@ -8,6 +9,18 @@ import numpy.typing as npt
 from src.core.risk_model import RiskModel
 
 
+@dataclass
+class _QuadraticProgram:
+    """Parameterized QP, canonicalized once and re-solved per rebalance."""
+
+    key: Tuple[float, ...]
+    problem: cp.Problem
+    w: cp.Variable
+    mu: cp.Parameter
+    risk_factor: cp.Parameter  # F with F' F = Sigma
+    prev_w: cp.Parameter
+
+
 class PortfolioManager:
     def __init__(
         self,
@@ -24,6 +37,7 @@ class PortfolioManager:
         self.sigma: Optional[npt.NDArray[np.float64]] = None
         self.loadings: Optional[npt.NDArray[np.float64]] = None
         self.expected_factor_returns: Optional[npt.NDArray[np.float64]] = None
+        self._qp: Optional[_QuadraticProgram] = None
 
         # Soft Constraint Scalars (Lagrange Multipliers)
         self.lambda_net = 100.0  # Net exposure (neutrality)
@@ -32,7 +46,7 @@ class PortfolioManager:
 
         # Safety Defaults
         self.msg_count = 0
-        self.last_msg_ts = datetime.now()
+        self.last_msg_ts: Optional[datetime] = None
         self.max_msgs = 10
         self.max_dd = -0.1
         self.peak_equity = 1.0
@@ -47,12 +61,14 @@ class PortfolioManager:
         self, returns_history: npt.NDArray[np.float64]
     ) -> None:
         """
-        Calculates and caches the PCA-based risk parameters.
+        Calculates and caches the PCA-based risk parameters, plus the
+        mean historical factor return from the same fit.
         Should be called once at the start of the trading day.
         """
-        self.sigma, self.loadings = RiskModel.estimate_pca_covariance(
+        self.sigma, self.loadings, factor_rets = RiskModel.estimate_pca_model(
             returns_history
         )
+        self.expected_factor_returns = np.mean(factor_rets, axis=0)
 
     def get_factor_returns(
         self, returns_history: npt.NDArray[np.float64]
@@ -60,7 +76,13 @@ class PortfolioManager:
         """Calculates realized factor returns for the given history."""
         return RiskModel.get_factor_returns(returns_history)
 
-    def check_safety(self, equity: float) -> bool:
+    def check_safety(
+        self, equity: float, now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Applies the kill switch and message rate limit. Backtests pass the
+        simulated clock as 'now' so the limit tracks simulated time.
+        """
         if self.killed:
             return False
         # Kill Switch
@@ -70,14 +92,86 @@ class PortfolioManager:
             self.killed = True
             return False
         # Rate Limit
-        now = datetime.now()
-        if (now - self.last_msg_ts).total_seconds() < 1.0:
+        now = now or datetime.now()
+        last = self.last_msg_ts
+        if last is not None and (now - last).total_seconds() < 1.0:
             self.msg_count += 1
         else:
             self.msg_count = 1
             self.last_msg_ts = now
         return self.msg_count <= self.max_msgs
 
+    @staticmethod
+    def _risk_factor(
+        sigma: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Returns F such that F' F = Sigma (clipping tiny negative eigs)."""
+        eigvals, eigvecs = np.linalg.eigh(sigma)
+        factor = (eigvecs * np.sqrt(np.maximum(eigvals, 0.0))).T
+        return cast(npt.NDArray[np.float64], factor)
+
+    @staticmethod
+    def _weights_vec(
+        values: Dict[int, float], iids: List[int]
+    ) -> npt.NDArray[np.float64]:
+        """Dense float64 vector of 'values' aligned to iids (0.0 if absent)."""
+        return np.fromiter(
+            (values.get(i, 0.0) for i in iids),
+            dtype=np.float64,
+            count=len(iids),
+        )
+
+    def _get_problem(self, n: int) -> _QuadraticProgram:
+        """
+        Builds the DPP-compliant QP for n assets, reusing the cached one
+        while the universe size and penalty settings are unchanged.
+        """
+        key = (
+            float(n),
+            self.risk_aversion,
+            self.max_pos,
+            self.tc_penalty,
+            self.leverage_limit,
+            self.lambda_net,
+            self.lambda_gross,
+            self.lambda_pos,
+        )
+        if self._qp is not None and self._qp.key == key:
+            return self._qp
+
+        w = cp.Variable(n)
+        mu = cp.Parameter(n)
+        risk_factor = cp.Parameter((n, n))
+        prev_w = cp.Parameter(n)
+
+        # 1. Objective Components
+        risk = cp.sum_squares(risk_factor @ w)
+        tc = self.tc_penalty * cp.norm(w - prev_w, 1)
+        impact = 0.005 * cp.sum(cp.power(cp.abs(w - prev_w), 1.5))
+
+        # 2. Soft Constraints
+        net_pen = self.lambda_net * cp.square(cp.sum(w))
+        gross_pen = self.lambda_gross * cp.square(
+            cp.pos(cp.norm(w, 1) - self.leverage_limit)
+        )
+        pos_pen = self.lambda_pos * cp.sum(
+            cp.square(cp.pos(cp.abs(w) - self.max_pos))
+        )
+
+        obj = cp.Maximize(
+            w @ mu
+            - 0.5 * self.risk_aversion * risk
+            - tc
+            - impact
+            - net_pen
+            - gross_pen
+            - pos_pen
+        )
+        self._qp = _QuadraticProgram(
+            key, cp.Problem(obj), w, mu, risk_factor, prev_w
+        )
+        return self._qp
+
     def optimize(
         self,
         forecasts: Dict[int, float],
@@ -105,46 +199,21 @@ class PortfolioManager:
                 return self.current_weights
 
             # 2. Total Expected Return Reconstruction
-            epsilon = np.array([forecasts[i] for i in iids])
-            mu = epsilon.copy()
+            mu = self._weights_vec(forecasts, iids)
             if factor_returns is not None and self.loadings is not None:
                 # self.loadings is (N_assets, K_factors)
                 # factor_returns is (K_factors,)
                 mu += self.loadings @ factor_returns
 
-            w = cp.Variable(n)
-            prev_w = np.array([self.current_weights.get(i, 0.0) for i in iids])
-
-            # 3. Objective Components
-            risk = cp.quad_form(w, cp.psd_wrap(sigma))
-            tc = self.tc_penalty * cp.norm(w - prev_w, 1)
-            impact = 0.005 * cp.sum(cp.power(cp.abs(w - prev_w), 1.5))
-
-            # 4. Soft Constraints
-            net_pen = self.lambda_net * cp.square(cp.sum(w))
-            gross_pen = self.lambda_gross * cp.square(
-                cp.pos(cp.norm(w, 1) - self.leverage_limit)
-            )
-            pos_pen = self.lambda_pos * cp.sum(
-                cp.square(cp.pos(cp.abs(w) - self.max_pos))
-            )
-
-            obj = cp.Maximize(
-                w @ mu
-                - 0.5 * self.risk_aversion * risk
-                - tc
-                - impact
-                - net_pen
-                - gross_pen
-                - pos_pen
-            )
-
-            cp.Problem(obj).solve()
+            qp = self._get_problem(n)
+            qp.mu.value = mu
+            qp.risk_factor.value = self._risk_factor(sigma)
+            qp.prev_w.value = self._weights_vec(self.current_weights, iids)
+            qp.problem.solve(warm_start=True)
 
+            w = qp.w
             if w.value is not None:
-                self.current_weights = {
-                    iids[i]: float(w.value[i]) for i in range(n)
-                }
+                self.current_weights = dict(zip(iids, w.value.tolist()))
         except Exception:
             pass
 
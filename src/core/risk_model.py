@@ -45,7 +45,22 @@ class RiskModel:
         Decomposes returns into factor and specific risk using PCA.
         Returns: (Sigma, Loadings)
         """
-        pca, scaler, z, _ = RiskModel._fit_pca(returns, n_factors)
+        sigma, loadings, _ = RiskModel.estimate_pca_model(returns, n_factors)
+        return sigma, loadings
+
+    @staticmethod
+    def estimate_pca_model(
+        returns: npt.NDArray[np.float64], n_factors: int = 3
+    ) -> Tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+    ]:
+        """
+        Covariance, loadings and realized factor returns from one PCA fit.
+        Returns: (Sigma, Loadings, Factor Returns (T_samples, K_factors))
+        """
+        pca, scaler, z, z_pca = RiskModel._fit_pca(returns, n_factors)
 
         loadings = pca.components_.T
         f_cov = loadings @ np.diag(pca.explained_variance_) @ loadings.T
@@ -56,7 +71,11 @@ class RiskModel:
         std = scaler.scale_
         sigma = sigma_z * np.outer(std, std)
 
-        return cast(npt.NDArray[np.float64], sigma), loadings
+        return (
+            cast(npt.NDArray[np.float64], sigma),
+            loadings,
+            cast(npt.NDArray[np.float64], z_pca),
+        )
 
     @staticmethod
     def get_residual_returns(
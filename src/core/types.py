@@ -2,7 +2,7 @@ import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 # Constants
 PRICE_VOLUME_COLS: List[str] = ["open", "high", "low", "close", "volume"]
@@ -20,34 +20,36 @@ class Timeframe(Enum):
     @property
     def minutes(self) -> int:
         """Returns the number of minutes in the timeframe."""
-        mapping = {
-            Timeframe.MINUTE: 1,
-            Timeframe.MIN_5: 5,
-            Timeframe.MIN_15: 15,
-            Timeframe.MIN_30: 30,
-            Timeframe.HOUR: 60,
-            Timeframe.DAY: 1440,
-        }
-        return mapping[self]
+        return _TIMEFRAME_MINUTES[self]
 
     @property
     def pandas_freq(self) -> str:
         """Returns a string compatible with pandas frequency."""
-        mapping = {
-            Timeframe.MINUTE: "1min",
-            Timeframe.MIN_5: "5min",
-            Timeframe.MIN_15: "15min",
-            Timeframe.MIN_30: "30min",
-            Timeframe.HOUR: "1h",
-            Timeframe.DAY: "D",
-        }
-        return mapping[self]
+        return _TIMEFRAME_PANDAS_FREQ[self]
 
     @property
     def is_intraday(self) -> bool:
         return self != Timeframe.DAY
 
 
+_TIMEFRAME_MINUTES: Dict[Timeframe, int] = {
+    Timeframe.MINUTE: 1,
+    Timeframe.MIN_5: 5,
+    Timeframe.MIN_15: 15,
+    Timeframe.MIN_30: 30,
+    Timeframe.HOUR: 60,
+    Timeframe.DAY: 1440,
+}
+_TIMEFRAME_PANDAS_FREQ: Dict[Timeframe, str] = {
+    Timeframe.MINUTE: "1min",
+    Timeframe.MIN_5: "5min",
+    Timeframe.MIN_15: "15min",
+    Timeframe.MIN_30: "30min",
+    Timeframe.HOUR: "1h",
+    Timeframe.DAY: "D",
+}
+
+
 @dataclass
 class Security:
     internal_id: int
@@ -95,6 +97,7 @@ class QueryConfig:
     timeframe: Timeframe = Timeframe.DAY
     as_of: Optional[datetime] = None
     adjust: bool = True
+    resample: bool = True  # intraday: fall back to minute bars
 
 
 class OrderState(Enum):
@@ -5,15 +5,14 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 
-import numpy as np
 from dotenv import load_dotenv
 
 from src.alpha_library.models import MomentumModel
 from src.core.alpha_engine import (
     AlphaEngine,
+    AlphaModel,
     ModelRunConfig,
     SignalCombiner,
-    SignalProcessor,
 )
 from src.core.data_platform import DataPlatform
 from src.core.execution_handler import ExecutionHandler
@@ -97,7 +96,7 @@ def run_strategy_loop(
     logger.info("Strategy Loop Started. Warming up...")
     start_hist, end_hist = history_range
     pm = PortfolioManager()
-    models = [MomentumModel()]
+    models: List[AlphaModel] = [MomentumModel()]
 
     # Calculate initial risk model
     hist_bars = data.get_bars(
@@ -121,43 +120,38 @@ def run_strategy_loop(
         )
         if not pivot_rets.empty:
             pm.update_risk_model(pivot_rets.values)
-            hist_f_rets = pm.get_factor_returns(pivot_rets.values)
-            expected_factor_returns = np.mean(hist_f_rets, axis=0)
+            expected_factor_returns = pm.expected_factor_returns
             logger.info("Risk Model updated with historical factor returns.")
 
     executor = ExecutionHandler(backend)
+    # iids were resolved from tickers up front, so this lookup is fixed
+    iid_to_ticker = dict(zip(iids, tickers))
 
     while True:
         try:
             current_time = datetime.now()
 
             # 1. Alpha Generation
-            signals = [
-                AlphaEngine.run_model(
-                    data,
-                    m,
-                    iids,
-                    ModelRunConfig(current_time, Timeframe.MIN_30),
-                )
-                for m in models
-            ]
-            combined = SignalCombiner.combine(
-                [SignalProcessor.zscore(s) for s in signals]
+            signals = AlphaEngine.run_models(
+                data,
+                models,
+                iids,
+                ModelRunConfig(current_time, Timeframe.MIN_30),
             )
+            combined = SignalCombiner.combine(signals, standardize=True)
 
             # 2. Portfolio Optimization
             pm.optimize(combined, factor_returns=expected_factor_returns)
 
             # 3. Data Retrieval
             prices = backend.get_prices(tickers)
-            reverse_ism = data.reverse_ism
 
             # 4. Target Generation
             goal_positions: Dict[str, float] = {}
             total_equity = 100000.0  # Placeholder, usually fetch from account
 
             for iid, weight in pm.current_weights.items():
-                ticker = reverse_ism.get(iid)
+                ticker = iid_to_ticker.get(iid)
                 if ticker and ticker in prices and prices[ticker] > 0:
                     safe_weight = max(min(weight, 0.1), -0.1)
                     target_qty = float(
@@ -3,7 +3,11 @@ from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 
-from src.alpha_library.features import residual_vol_20, returns_residual
+from src.alpha_library.features import (
+    residual_mom_10,
+    residual_vol_20,
+    returns_residual,
+)
 from src.core.alpha_engine import FEATURES
 from src.core.data_platform import Bar, DataPlatform
 from src.core.types import QueryConfig, Timeframe
@@ -12,6 +16,9 @@ from src.core.types import QueryConfig, Timeframe
 NUM_ASSETS = 5
 RESIDUAL_LENGTH = 5
 TOLERANCE = 1e-10
+SCALE_ROWS = 200
+LARGE_SCALE = 1e8
+SMALL_SCALE = 1e-4
 
 
 def test_feature_calculates_returns_residual_with_sufficient_data() -> None:
@@ -36,6 +43,46 @@ def test_feature_calculates_volatility_of_residuals() -> None:
     assert len(residual_vol_20(df, Timeframe.MIN_30)) == RESIDUAL_LENGTH
 
 
+def test_feature_rolling_windows_do_not_cross_securities() -> None:
+    rng = np.random.default_rng(0)
+    n = 60
+    df = pd.DataFrame(
+        {
+            "internal_id": rng.integers(1, 4, n),  # interleaved securities
+            "returns_residual_30min": rng.normal(size=n),
+        },
+        index=rng.permutation(n),
+    )
+    grouped = df.groupby("internal_id")["returns_residual_30min"]
+    expected = grouped.rolling(window=10).sum().reset_index(level=0, drop=True)
+    pd.testing.assert_series_equal(
+        residual_mom_10(df, Timeframe.MIN_30),
+        expected.reindex(df.index),
+        check_names=False,
+        rtol=TOLERANCE,
+    )
+
+
+def test_feature_rolling_std_does_not_leak_across_security_scales() -> None:
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(
+        {
+            "internal_id": [1] * SCALE_ROWS + [2] * SCALE_ROWS,
+            "returns_residual_30min": np.r_[
+                LARGE_SCALE * (1 + rng.normal(size=SCALE_ROWS)),
+                SMALL_SCALE * rng.normal(size=SCALE_ROWS),
+            ],
+        }
+    )
+    grouped = df.groupby("internal_id")["returns_residual_30min"]
+    expected = grouped.rolling(window=20).std().reset_index(level=0, drop=True)
+    result = residual_vol_20(df, Timeframe.MIN_30)
+    assert (result.iloc[SCALE_ROWS:].dropna() > 0).all()
+    pd.testing.assert_series_equal(
+        result, expected, check_names=False, rtol=TOLERANCE
+    )
+
+
 def test_feature_calculation_robustness_across_random_returns(
     data_platform: DataPlatform,
 ) -> None:
@@ -3,6 +3,7 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from src.alpha_library.models import (
     EarningsModel,
@@ -33,6 +34,15 @@ def test_momentum_model_generates_signals_from_idiosyncratic_outperformance(
     assert iid in signals
 
 
+def test_momentum_model_passes_through_momentum_and_skips_nans() -> None:
+    model = MomentumModel()
+    df = pd.DataFrame(
+        {"residual_mom_10_30min": [0.3, np.nan, -0.1]},
+        index=[ASSET_1, ASSET_2, ASSET_3],
+    )
+    assert model.compute_signals(df) == {ASSET_1: 0.3, ASSET_3: -0.1}
+
+
 def test_reversion_model_forecasts_mean_reversion_from_residual_returns() -> (
     None
 ):
@@ -63,6 +73,18 @@ def test_reversion_model_gracefully_handles_zero_volatility_and_nans() -> None:
     assert ASSET_4 not in signals_edge
 
 
+def test_reversion_model_drops_non_finite_inputs() -> None:
+    model = ReversionModel()
+    df = pd.DataFrame(
+        {
+            "returns_residual_30min": [np.inf, 0.1, 0.1],
+            "residual_vol_20_30min": [0.01, np.inf, 0.01],
+        },
+        index=[ASSET_1, ASSET_2, ASSET_3],
+    )
+    assert model.compute_signals(df) == {ASSET_3: -(0.1 / 0.01)}
+
+
 def test_earnings_model_signals_positive_surprise_events(
     data_platform: DataPlatform,
 ) -> None:
@@ -138,6 +160,7 @@ def test_earnings_signal_decays_linearly_over_time(
 
     cfg1 = ModelRunConfig(timestamp=ts, timeframe=Timeframe.DAY)
     sig1 = AlphaEngine.run_model(data_platform, model, [iid], cfg1)[iid]
+    assert sig1 == pytest.approx(0.5 * (1 - 1 / 24))
 
     future_ts = ts + timedelta(hours=10)
     bar2 = Bar(
@@ -20,6 +20,14 @@ def test_performanceanalyzer_calculates_sharpe_ratio_correctly() -> None:
     assert pytest.approx(res) == expected
 
 
+def test_performanceanalyzer_sharpe_skips_nans_and_single_points() -> None:
+    assert PerformanceAnalyzer.calculate_sharpe(pd.Series([0.01])) == 0.0
+    rets = pd.Series([0.01, np.nan, -0.01, 0.02])
+    expected = rets.mean() / rets.std() * np.sqrt(252)
+    res = PerformanceAnalyzer.calculate_sharpe(rets)
+    assert pytest.approx(res) == expected
+
+
 def test_performanceanalyzer_calculates_drawdowns_accurately() -> None:
     empty_series = pd.Series([], dtype=float)
     res_empty = PerformanceAnalyzer.calculate_drawdown(empty_series)
@@ -31,6 +39,20 @@ def test_performanceanalyzer_calculates_drawdowns_accurately() -> None:
     assert pytest.approx(res["current_dd"]) == (120 - 120) / 120.0
 
 
+def test_performanceanalyzer_accepts_raw_arrays() -> None:
+    equity = np.array([100.0, 110.0, 90.0, 95.0])
+    assert PerformanceAnalyzer.calculate_drawdown(
+        equity
+    ) == PerformanceAnalyzer.calculate_drawdown(pd.Series(equity))
+    assert PerformanceAnalyzer.calculate_drawdown(np.array([])) == {
+        "max_dd": 0.0
+    }
+    rets = np.array([0.01, -0.01, 0.02])
+    assert PerformanceAnalyzer.calculate_sharpe(
+        rets
+    ) == PerformanceAnalyzer.calculate_sharpe(pd.Series(rets))
+
+
 def test_performanceanalyzer_decomposes_returns_via_factor_attribution() -> (
     None
 ):
@@ -59,6 +81,28 @@ def test_performanceanalyzer_generates_performance_table_with_resampling() -> (
     assert len(table_me) == ME_TABLE_LEN
 
 
+def test_performanceanalyzer_performance_table_skips_empty_periods() -> None:
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                ["2025-01-03 10:00", "2025-01-03 15:00", "2025-01-06 10:00"]
+            ),
+            "gross_ret": [0.01, -0.02, 0.03],
+            "net_ret": [0.01, -0.02, 0.03],
+        }
+    )
+    table = PerformanceAnalyzer.generate_performance_table(df, freq="D")
+    assert list(table.index) == [
+        pd.Timestamp("2025-01-03"),
+        pd.Timestamp("2025-01-06"),
+        "Summary",
+    ]
+    assert (
+        table.loc["Summary", "Return (Net)"] == f"{1.01 * 0.98 * 1.03 - 1:.2%}"
+    )
+    assert table.loc[pd.Timestamp("2025-01-03"), "Max Drawdown"] == "-2.00%"
+
+
 def test_performanceanalyzer_handles_empty_datasets_gracefully() -> None:
     df = pd.DataFrame(columns=["timestamp", "gross_ret", "net_ret"])
     table = PerformanceAnalyzer.generate_performance_table(df)
@@ -1,11 +1,17 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
+import pytest
+
 from src.alpha_library.models import MomentumModel
 from src.backtesting.demo import MarketDataMock
 from src.backtesting.engine import BacktestConfig, BacktestEngine
 from src.core.portfolio_manager import PortfolioManager
-from src.core.types import Timeframe
+from src.core.types import Bar, CorporateAction, Timeframe
+
+SPLIT_RATIO = 2.0
+MINUTE_BARS = 61
+MINUTE_FALLBACK_RETURN = 0.30
 
 
 def test_backtest_engine_completes_full_cycle_and_reports_stats(
@@ -38,3 +44,96 @@ def test_backtest_engine_completes_full_cycle_and_reports_stats(
     assert "total_return" in report
     assert "sharpe" in report
     assert len(engine.interval_results) > 0
+
+
+def test_backtest_engine_extends_equity_curve_across_runs(
+    data_platform: Any,
+) -> None:
+    tickers = ["AAPL", "MSFT"]
+    data_platform.providers = [MarketDataMock()]
+    data_platform.sync_data(
+        tickers,
+        datetime(2025, 1, 1),
+        datetime(2025, 1, 6),
+        timeframe=Timeframe.MIN_30,
+    )
+    engine = BacktestEngine(data_platform, PortfolioManager())
+    for start, end in [
+        (datetime(2025, 1, 1), datetime(2025, 1, 2)),
+        (datetime(2025, 1, 3), datetime(2025, 1, 6)),
+    ]:
+        report = engine.run(
+            BacktestConfig(
+                start_date=start,
+                end_date=end,
+                alpha_models=[MomentumModel()],
+                weights=[1.0],
+                tickers=tickers,
+                timeframe=Timeframe.MIN_30,
+            )
+        )
+
+    curve = engine.equity_curve
+    assert len(curve) == len(engine.interval_results) + 1
+    assert curve[0] == engine.capital
+    assert report["final_equity"] == curve[-1]
+
+
+def test_backtest_engine_interval_return_is_neutral_to_split_at_next_bar(
+    data_platform: Any,
+) -> None:
+    ts = datetime(2025, 1, 2, 10, 0)
+    next_ts = ts + timedelta(minutes=30)
+    iid = data_platform.register_security("AAPL")
+    tf = Timeframe.MIN_30
+    data_platform.add_bars(
+        [
+            Bar(iid, ts, 100, 100, 100, 100, 1000, timeframe=tf),
+            Bar(iid, next_ts, 50, 50, 50, 50, 2000, timeframe=tf),
+        ]
+    )
+    data_platform.add_ca(CorporateAction(iid, next_ts, "SPLIT", SPLIT_RATIO))
+
+    engine = BacktestEngine(data_platform, PortfolioManager())
+    config = BacktestConfig(
+        start_date=ts, end_date=ts, alpha_models=[], weights=[], timeframe=tf
+    )
+    ret = engine._simulate_interval_returns(
+        [iid], {iid: 1.0}, ts, config, "close_30min"
+    )
+    assert ret == 0.0
+
+
+def test_backtest_engine_interval_return_from_minute_fallback_spans_interval(
+    data_platform: Any,
+) -> None:
+    ts = datetime(2025, 1, 2, 10, 0)
+    iid = data_platform.register_security("AAPL")
+    data_platform.add_bars(
+        [
+            Bar(
+                iid,
+                ts + timedelta(minutes=i),
+                100 + i,
+                100 + i,
+                100 + i,
+                100 + i,
+                1000,
+                timeframe=Timeframe.MINUTE,
+            )
+            for i in range(MINUTE_BARS)  # price rises 1 per minute
+        ]
+    )
+
+    engine = BacktestEngine(data_platform, PortfolioManager())
+    config = BacktestConfig(
+        start_date=ts,
+        end_date=ts,
+        alpha_models=[],
+        weights=[],
+        timeframe=Timeframe.MIN_30,
+    )
+    ret = engine._simulate_interval_returns(
+        [iid], {iid: 1.0}, ts, config, "close_30min"
+    )
+    assert ret == pytest.approx(MINUTE_FALLBACK_RETURN)
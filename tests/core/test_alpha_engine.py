@@ -2,6 +2,7 @@ import threading
 import time
 from datetime import datetime
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -52,6 +53,42 @@ def test_alpha_engine_calculates_signals_from_hydrated_features(
     assert isinstance(signals[iid], float)
 
 
+def test_alpha_engine_skips_history_for_models_without_features(
+    populated_platform: Any,
+) -> None:
+    data, iid, ts = populated_platform
+
+    class SnapshotModel(AlphaModel):
+        def compute_signals(self, latest: pd.DataFrame) -> Dict[int, float]:
+            return {int(i): 1.0 for i in latest.index}
+
+    config = ModelRunConfig(timestamp=ts, timeframe=Timeframe.MIN_30)
+    with patch.object(data, "get_bars", wraps=data.get_bars) as spy:
+        signals = AlphaEngine.run_model(data, SnapshotModel(), [iid], config)
+
+    assert signals == {iid: 1.0}
+    assert spy.call_args.args[1].start == ts
+
+
+def test_alpha_engine_runs_several_models_off_one_bar_fetch(
+    populated_platform: Any,
+) -> None:
+    data, iid, ts = populated_platform
+
+    class CloseModel(AlphaModel):
+        def compute_signals(self, latest: pd.DataFrame) -> Dict[int, float]:
+            return {int(i): 1.0 for i in latest.index}
+
+    models = [MockModel(), CloseModel(), MockModel()]
+    config = ModelRunConfig(timestamp=ts, timeframe=Timeframe.MIN_30)
+    expected = [AlphaEngine.run_model(data, m, [iid], config) for m in models]
+    with patch.object(data, "get_bars", wraps=data.get_bars) as spy:
+        signals = AlphaEngine.run_models(data, models, [iid], config)
+
+    assert signals == expected
+    assert spy.call_count == 1
+
+
 def test_signal_processor_standardizes_to_zscores() -> None:
     assert SignalProcessor.zscore({}) == {}
     z = SignalProcessor.zscore(TEST_SIGNALS)
@@ -72,6 +109,25 @@ def test_signal_combiner_aggregates_multiple_models_with_weights() -> None:
     assert pytest.approx(combined[2]) == W2
 
 
+def test_signal_combiner_standardize_matches_per_model_zscores() -> None:
+    signals = [TEST_SIGNALS, {2: 5.0, 4: -1.0, 5: 3.0}, ZERO_STD_SIGNALS, {}]
+    weights = [0.5, 0.3, 0.1, 0.1]
+    expected = SignalCombiner.combine(
+        [SignalProcessor.zscore(s) for s in signals], weights=weights
+    )
+    fused = SignalCombiner.combine(signals, weights=weights, standardize=True)
+    assert list(fused) == list(expected)
+    assert fused == pytest.approx(expected)
+
+
+def test_signal_combiner_treats_missing_assets_as_zero_signal() -> None:
+    s1, s2 = {1: 1.0, 2: 0.5}, {2: 1.5, 3: 2.0}
+    combined = SignalCombiner.combine([s1, s2], weights=SIGNAL_WEIGHTS)
+    assert list(combined) == [1, 2, 3]
+    assert pytest.approx(combined[1]) == SIGNAL_WEIGHTS[0]
+    assert pytest.approx(combined[3]) == 2.0 * SIGNAL_WEIGHTS[1]
+
+
 def test_alpha_engine_isolates_execution_context_per_thread(
     data_platform: DataPlatform,
 ) -> None:
@@ -1,10 +1,16 @@
 import warnings
 from datetime import datetime, timedelta
 from typing import Any, List
+from unittest.mock import patch
 
 import pandas as pd
 
-from src.core.data_platform import CorporateAction, DataPlatform, Event
+from src.core.data_platform import (
+    CorporateAction,
+    DataPlatform,
+    Event,
+    _latest_known,
+)
 from src.core.types import Bar, QueryConfig, Timeframe
 from src.gateways.base import BarProvider, CorporateActionProvider
 
@@ -77,6 +83,24 @@ def test_dataplatform_adjusts_prices_for_splits(
     assert df[df.timestamp == ts1].iloc[0]["close_1D"] == ADJUSTED_PRICE
 
 
+def test_dataplatform_reads_corporate_actions_once_per_adjusted_query(
+    data_platform: DataPlatform,
+) -> None:
+    ts1, ts2 = datetime(2025, 1, 1), datetime(2025, 1, 2)
+    iid = data_platform.register_security(AAPL_TICKER)
+    bar = Bar(iid, ts1, 100, 100, 100, 100, 1000, timeframe=Timeframe.DAY)
+    data_platform.add_bars([bar])
+    data_platform.add_ca(CorporateAction(iid, ts2, "SPLIT", SPLIT_RATIO))
+    query = QueryConfig(start=ts1, end=ts2, timeframe=Timeframe.DAY)
+    with patch.object(
+        data_platform, "_read", wraps=data_platform._read
+    ) as spy:
+        df = data_platform.get_bars([iid], query)
+
+    assert df.iloc[0]["close_1D"] == ADJUSTED_PRICE
+    assert [c.args[0] for c in spy.call_args_list].count("ca_df") == 1
+
+
 def test_dataplatform_stores_and_retrieves_events(
     data_platform: DataPlatform,
 ) -> None:
@@ -89,6 +113,27 @@ def test_dataplatform_stores_and_retrieves_events(
     assert events[0].value["eps"] == EARNINGS_EPS
 
 
+def test_dataplatform_returns_events_as_columns(
+    data_platform: DataPlatform,
+) -> None:
+    ts = datetime(2025, 1, 1)
+    iid = data_platform.register_security(AAPL_TICKER)
+    assert data_platform.get_events_df([iid]).empty
+    data_platform.add_events(
+        [Event(iid, ts, "EARNINGS", {"eps": EARNINGS_EPS})]
+    )
+    df = data_platform.get_events_df([iid], types=["EARNINGS"])
+    assert list(df.columns) == [
+        "internal_id",
+        "timestamp",
+        "event_type",
+        "value",
+        "timestamp_knowledge",
+    ]
+    assert df["value"].iloc[0] == {"eps": EARNINGS_EPS}
+    assert data_platform.get_events([iid])[0].value == df["value"].iloc[0]
+
+
 def test_dataplatform_restores_state_from_db(arctic_db_path: str) -> None:
     ts, iid = datetime(2025, 1, 1, 12, 0), TEST_IID
     dp1 = DataPlatform(db_path=arctic_db_path, clear=True)
@@ -100,6 +145,17 @@ def test_dataplatform_restores_state_from_db(arctic_db_path: str) -> None:
     assert df.iloc[0]["close_1D"] == BASE_PRICE
 
 
+def test_dataplatform_security_cache_refreshes_after_registration(
+    data_platform: DataPlatform,
+) -> None:
+    aapl = data_platform.register_security(AAPL_TICKER)
+    secs = data_platform.sec_df
+    secs["ticker"] = FB_TICKER  # callers get a copy, not the cache
+    assert data_platform.reverse_ism == {aapl: AAPL_TICKER}
+    msft = data_platform.register_security(MSFT_TICKER)
+    assert data_platform.reverse_ism == {aapl: AAPL_TICKER, msft: MSFT_TICKER}
+
+
 def test_dataplatform_respects_bitemporal_as_of_time(
     data_platform: DataPlatform,
 ) -> None:
@@ -331,6 +387,82 @@ def test_dataplatform_sync_resolves_internal_ids(arctic_db_path: str) -> None:
     assert dp.ca_df.iloc[0]["internal_id"] == expected_iid
 
 
+def test_dataplatform_sync_maps_rows_to_listing_live_on_each_date(
+    arctic_db_path: str,
+) -> None:
+    delist = datetime(2025, 1, 2)
+
+    class MockProv(BarProvider):
+        def fetch_bars(
+            self,
+            tickers: List[str],
+            start: datetime,
+            end: datetime,
+            timeframe: Timeframe = Timeframe.DAY,
+        ) -> pd.DataFrame:
+            days = pd.date_range(start, end, freq="D")
+            return pd.DataFrame(
+                {
+                    "ticker": FB_TICKER,
+                    "timestamp": days,
+                    "open": BASE_PRICE,
+                    "high": BASE_PRICE,
+                    "low": BASE_PRICE,
+                    "close": BASE_PRICE,
+                    "volume": DEFAULT_VOLUME,
+                }
+            )
+
+    dp = DataPlatform(MockProv(), db_path=arctic_db_path, clear=True)
+    old_iid = dp.register_security(FB_TICKER, end=delist)
+    dp.sync_data([FB_TICKER], datetime(2025, 1, 1), datetime(2025, 1, 4))
+
+    bars = dp.get_bars(
+        [old_iid, old_iid + 1],
+        QueryConfig(start=datetime(2025, 1, 1), end=datetime(2025, 1, 4)),
+    )
+    ids = bars.sort_values("timestamp").internal_id.tolist()
+    assert ids == [old_iid, old_iid, old_iid + 1, old_iid + 1]
+    assert len(dp.get_securities([FB_TICKER])) == U_SIZE_2
+
+
+def test_dataplatform_sync_registers_new_tickers_in_one_batch(
+    arctic_db_path: str,
+) -> None:
+    tickers = [MSFT_TICKER, AAPL_TICKER, META_TICKER]
+
+    class MockProv(BarProvider):
+        def fetch_bars(
+            self,
+            tickers: List[str],
+            start: datetime,
+            end: datetime,
+            timeframe: Timeframe = Timeframe.DAY,
+        ) -> pd.DataFrame:
+            return pd.DataFrame(
+                {
+                    "ticker": tickers,
+                    "timestamp": start,
+                    "open": BASE_PRICE,
+                    "high": BASE_PRICE,
+                    "low": BASE_PRICE,
+                    "close": BASE_PRICE,
+                    "volume": DEFAULT_VOLUME,
+                }
+            )
+
+    dp = DataPlatform(MockProv(), db_path=arctic_db_path, clear=True)
+    dp.register_security(FB_TICKER)
+    dp.sync_data(tickers, datetime(2025, 1, 1), datetime(2025, 1, 1))
+
+    assert [dp.get_internal_id(t) for t in tickers] == [
+        TEST_IID + 1,
+        TEST_IID + 2,
+        TEST_IID + 3,
+    ]
+    assert len(dp.lib.list_versions("sec_df")) == U_SIZE_2
+
+
 def test_dataplatform_metadata_persistence_audit(arctic_db_path: str) -> None:
     dp1 = DataPlatform(db_path=arctic_db_path, clear=True)
     dp1.register_security(AAPL_TICKER, internal_id=PERSISTED_IID)
@@ -367,3 +499,42 @@ def test_dataplatform_aggregation_multi_chunk_audit(
     )
     df = data_platform.get_bars([iid], query)
     assert df.iloc[0]["volume_30min"] == AGGREGATED_VOLUME
+
+    query.resample = False
+    assert data_platform.get_bars([iid], query).empty
+
+
+def test_dataplatform_add_bars_resolves_unknown_ids_by_ticker(
+    data_platform: DataPlatform,
+) -> None:
+    aapl = data_platform.register_security(AAPL_TICKER)
+    ts = datetime(2025, 1, 1, 12, 0)
+    data_platform.add_bars(
+        [
+            Bar(0, ts, 1, 1, 1, 1, 1, _ticker=AAPL_TICKER),
+            Bar(0, ts, 1, 1, 1, 1, 1, _ticker=MSFT_TICKER),
+            Bar(0, ts + timedelta(days=1), 1, 1, 1, 1, 1, _ticker=MSFT_TICKER),
+        ]
+    )
+
+    msft = data_platform.get_internal_id(MSFT_TICKER)
+    query = QueryConfig(start=ts, end=ts + timedelta(days=1))
+    df = data_platform.get_bars([aapl, msft], query)
+    assert sorted(df.internal_id.tolist()) == [aapl, msft, msft]
+    assert len(data_platform.get_securities([MSFT_TICKER])) == 1
+
+
+def test_latest_known_keeps_latest_revision_row_including_nans() -> None:
+    ts = datetime(2025, 1, 1, 10, 0)
+    df = pd.DataFrame(
+        {
+            "internal_id": [TEST_IID, TEST_IID],
+            "timestamp": [ts, ts],
+            "close": [BASE_PRICE, float("nan")],
+            "timestamp_knowledge": [ts, ts + timedelta(days=1)],
+        }
+    )
+    latest = _latest_known(df)
+    assert len(latest) == 1
+    assert pd.isna(latest["close"].iloc[0])
+    assert list(latest.columns) == list(df.columns)
@@ -12,6 +12,7 @@ from src.core.types import OrderSide
 
 # Constants to avoid magic values
 AAPL_TICKER = "AAPL"
+MSFT_TICKER = "MSFT"
 START_QTY = 10.0
 START_PRICE = 100.0
 GOAL_QTY = 50.0
@@ -46,6 +47,38 @@ def test_execution_handler_rebalances_portfolio_using_sliced_orders(
     )
 
 
+def test_execution_handler_rebalance_skips_positions_within_tolerance(
+    mock_backend: Any,
+) -> None:
+    mock_backend.get_positions.return_value = {
+        AAPL_TICKER: GOAL_QTY + 0.05,
+        MSFT_TICKER: START_QTY,
+    }
+    handler = ExecutionHandler(mock_backend)
+    orders = handler.rebalance({AAPL_TICKER: GOAL_QTY}, interval=0)
+
+    assert len(orders) == 1
+    assert orders[0].ticker == MSFT_TICKER
+    assert orders[0].side == OrderSide.SELL
+    assert orders[0].quantity == START_QTY
+
+
+def test_execution_handler_fires_only_children_that_are_due(
+    mock_backend: Any,
+) -> None:
+    handler = ExecutionHandler(mock_backend)
+    handler.twap_execute(
+        MSFT_TICKER, TWAP_QTY, OrderSide.SELL, slices=TWAP_SLICES, interval=60
+    )
+    handler.twap_execute(AAPL_TICKER, TWAP_QTY, OrderSide.BUY, slices=1)
+    time.sleep(0.3)
+
+    assert mock_backend.submit_order.call_count == DUAL_SLICE_COUNT
+    mock_backend.submit_order.assert_any_call(
+        AAPL_TICKER, TWAP_QTY, OrderSide.BUY.value
+    )
+
+
 def test_execution_handler_stops_slicing_on_order_cancellation(
     mock_backend: Any,
 ) -> None:
@@ -104,3 +104,50 @@ def test_portfoliomanager_fails_without_sufficient_risk_parameters(
 ) -> None:
     pm.sigma = None
     assert pm.optimize({TEST_IID: 0.1}, returns_history=None) == {}
+
+
+def test_portfoliomanager_rate_limits_against_supplied_clock(
+    pm: PortfolioManager,
+) -> None:
+    pm.set_safety_limits(max_msgs=MAX_MSGS, max_drawdown=DRAWDOWN_LIMIT)
+    ts = datetime(2025, 1, 1, 10)
+    assert pm.check_safety(1.0, now=ts)
+    assert not pm.check_safety(1.0, now=ts)
+    assert pm.check_safety(1.0, now=ts + timedelta(hours=5))
+
+
+def test_portfoliomanager_reuses_compiled_problem_across_solves(
+    pm: PortfolioManager,
+) -> None:
+    returns = np.random.randn(20, 2) * 0.01
+    pm.optimize({TEST_IID: 0.1, TEST_IID_2: -0.1}, returns)
+    qp = pm._qp
+    pm.optimize({TEST_IID: 0.2, TEST_IID_2: -0.2}, returns)
+    assert pm._qp is qp
+
+    pm.tc_penalty = 0.1
+    pm.optimize({TEST_IID: 0.2, TEST_IID_2: -0.2}, returns)
+    assert pm._qp is not qp
+
+
+def test_portfoliomanager_optimize_leaves_previous_weights_untouched(
+    pm: PortfolioManager,
+) -> None:
+    returns = np.random.randn(20, 2) * 0.01
+    pm.optimize({TEST_IID: 0.1, TEST_IID_2: -0.1}, returns)
+    prev = pm.current_weights
+    snapshot = dict(prev)
+    pm.optimize({TEST_IID: -0.3, TEST_IID_2: 0.3}, returns)
+    assert pm.current_weights is not prev
+    assert prev == snapshot
+
+
+def test_portfoliomanager_caches_expected_factor_returns_from_one_fit(
+    pm: PortfolioManager,
+) -> None:
+    returns = np.random.default_rng(0).normal(0, 0.01, (40, 4))
+    assert pm.expected_factor_returns is None
+    pm.update_risk_model(returns)
+    expected = pm.get_factor_returns(returns).mean(axis=0)
+    assert pm.expected_factor_returns is not None
+    np.testing.assert_allclose(pm.expected_factor_returns, expected)